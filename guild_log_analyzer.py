@@ -1,94 +1,148 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
 import pandas as pd
+import numpy as np
 import re
-from datetime import datetime
+import csv
 import pytz
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from io import StringIO
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
-# Regular expression pattern to match the log entries
+# Regular expression pattern to match the log entries. The player name must
+# start on a non-space character so the lazy match can't trade characters
+# back and forth with the preceding \s+ when a line fails to match.
+# The action is split into the event (up to the first ';') and its details,
+# and the level reported in leave/kick events, e.g. "has Left the guild
+# (LVL: 21)", is picked out of the event by a lookahead, so every column
+# comes from this one pass.
 LOG_PATTERN = re.compile(
     r"^\d+\)\s+"
     r"(?P<timestamp>\d{1,2} \w{3} '\d{2} \d{2}:\d{2}[ap]m)\s+:\s+"
-    r"(?P<player>.+?)\s+"
-    r"(?P<action>(has|is|matches|PROMOTED|DEMOTED|JOINED|Left|Come|died)\s.+)$"
+    r"(?P<player>\S.*?)\s+"
+    r"(?P<event>(?:has|is|matches|PROMOTED|DEMOTED|JOINED|Left|Come|died)\s"
+    r"(?:(?=[^;]*?LVL: (?P<level>\d+)))?[^;]*)"
+    r"(?:;(?P<details>.*))?$"
 )
 
+# Cheap check for the "<number>) " prefix every log entry starts with
+_HEAD_PATTERN = re.compile(r"^\d+\)\s")
+
+# pyarrow is optional: Arrow-backed strings make the vectorized .str searches
+# much cheaper and its CSV writer is much faster than pandas' own. Fall back
+# to plain pandas when it isn't installed.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    _STRING_DTYPE = 'string'
+
+# Every value the Event Type column can take
+EVENT_TYPES = ['Death', 'Level Up', 'Join', 'Leave', 'Promotion', 'Demotion', 'Online', 'Other']
+
+# Columns shown to the user and exported; anything else in the DataFrame is
+# internal lookup data
+DISPLAY_COLUMNS = ['Timestamp', 'Player', 'Event', 'Details', 'Level', 'Event Type']
+
+# Pixel height of a row in the results table; set on the Treeview style and
+# used to work out how many rows fit in view
+TREE_ROW_HEIGHT = 20
+
+# How timestamps are shown in the table and written to exported CSVs
+TIMESTAMP_FORMAT = '%Y-%m-%d %I:%M:%S %p'
+
+# Number of recent filter masks kept by apply_filters
+MASK_CACHE_SIZE = 8
+
+# Timezone log timestamps are converted to (built once, not per line)
+_LOCAL_TZ = pytz.timezone('US/Eastern')
+
 def parse_log(file_content):
-    data = []
+    # Accept either the whole log as one string or any iterable of lines
+    # (e.g. an open file), so callers don't have to hold both in memory.
+    # Read errors propagate to the caller rather than being logged here.
+    if isinstance(file_content, str):
+        lines = file_content.strip().splitlines()
+    else:
+        lines = list(file_content)
 
     try:
-        for line in file_content.strip().splitlines():
-            line = line.strip()
-            match = LOG_PATTERN.match(line)
-            if match:
-                timestamp_str = match.group('timestamp')
-                try:
-                    timestamp = datetime.strptime(timestamp_str, "%d %b '%y %I:%M%p")
-                    # Convert to US Eastern Time
-                    local_tz = pytz.timezone('US/Eastern')
-                    timestamp = pytz.utc.localize(timestamp).astimezone(local_tz)
-                except ValueError:
-                    # Handle cases where AM/PM is missing or in incorrect format
-                    timestamp = pd.NaT
-                    logging.warning(f"Timestamp parsing failed for line: {line}")
-
-                player = match.group('player')
-                action = match.group('action')
-
-                # Further split the action into event type and details
-                if ';' in action:
-                    event_type, details = action.split(';', 1)
-                else:
-                    event_type = action
-                    details = ''
-
-                data.append({
-                    'Timestamp': timestamp.strftime('%Y-%m-%d %I:%M:%S %p') if timestamp is not pd.NaT else '',
-                    'Player': player.strip(),
-                    'Event': event_type.strip(),
-                    'Details': details.strip()
-                })
-            else:
-                logging.warning(f"Line didn't match pattern and was skipped: {line}")
+        lines = pd.Series(lines, dtype='string').str.strip()
+        # Only lines starting with an entry number can match, so skip the full
+        # pattern for everything else
+        candidates = lines[lines.str.match(_HEAD_PATTERN)]
+        # Match the candidates in one vectorized pass; unmatched lines come back as NA
+        matched = candidates.str.extract(LOG_PATTERN).dropna(subset=['timestamp'])
+        for line in lines.drop(matched.index):
+            logging.warning(f"Line didn't match pattern and was skipped: {line}")
+        lines = lines[matched.index]
+        if matched.empty:
+            return pd.DataFrame()
+
+        # Log timestamps are UTC with minute resolution; to_datetime caches
+        # repeated strings so each distinct one is parsed only once.
+        timestamps = pd.to_datetime(matched['timestamp'], format="%d %b '%y %I:%M%p", errors='coerce', utc=True)
+        for line in lines[timestamps.isna()]:
+            # Handle cases where AM/PM is missing or in incorrect format
+            logging.warning(f"Timestamp parsing failed for line: {line}")
+
+        df = pd.DataFrame({
+            # Keep timestamps as a tz-aware datetime column; they are only
+            # formatted as text when displayed.
+            'Timestamp': timestamps.dt.tz_convert(_LOCAL_TZ),
+            'Player': matched['player'].str.strip(),
+            'Event': matched['event'].str.strip(),
+            'Details': matched['details'].fillna('').str.strip(),
+            'Level': matched['level']
+        }).reset_index(drop=True)
     except Exception as e:
         logging.error(f"An error occurred while parsing the log: {e}")
         return pd.DataFrame()
 
-    return pd.DataFrame(data)
+    return df
 
 def clean_data(df):
-    # Extract Level information if available
-    df['Level'] = df['Event'].str.extract(r'LVL: (\d+)', expand=False)
-    df['Level'] = pd.to_numeric(df['Level'], errors='coerce')
-
-    # Categorize events
-    def categorize_event(event_str):
-        if 'has died at level' in event_str or 'has died' in event_str or ('has Left the guild' in event_str and '[D]' in event_str):
-            return 'Death'
-        elif 'Leveled to' in event_str:
-            return 'Level Up'
-        elif 'JOINED the guild' in event_str or 'has JOINED the guild' in event_str:
-            return 'Join'
-        elif 'Left the guild' in event_str or 'is no longer in the Guild' in event_str:
-            return 'Leave'
-        elif 'PROMOTED' in event_str:
-            return 'Promotion'
-        elif 'DEMOTED' in event_str:
-            return 'Demotion'
-        elif 'Come ONLINE after being INACTIVE' in event_str:
-            return 'Online'
-        else:
-            return 'Other'
-
-    df['Event Type'] = df['Event'].apply(categorize_event)
+    # Convert the Level digits captured by parse_log, if available
+    df['Level'] = pd.to_numeric(df['Level'], errors='coerce', downcast='integer')
+
+    # Categorize events; the first matching condition wins
+    event = df['Event']
+
+    def has(text):
+        return event.str.contains(text, regex=False, na=False)
+
+    conditions = [
+        has('has died') | (has('has Left the guild') & has('[D]')),
+        has('Leveled to'),
+        has('JOINED the guild'),
+        has('Left the guild') | has('is no longer in the Guild'),
+        has('PROMOTED'),
+        has('DEMOTED'),
+        has('Come ONLINE after being INACTIVE'),
+    ]
+    choices = ['Death', 'Level Up', 'Join', 'Leave', 'Promotion', 'Demotion', 'Online']
+    # Categories in alphabetical order so sorting by Event Type stays alphabetical
+    df['Event Type'] = pd.Categorical(np.select(conditions, choices, default='Other'), categories=sorted(EVENT_TYPES))
+    df['Player'] = df['Player'].astype(_STRING_DTYPE)
+    # Lowercased copy so the player filter doesn't casefold the column on every run
+    df['_player_lc'] = df['Player'].str.lower()
     return df
 
+def format_for_display(df):
+    # The user-facing columns as the text shown in the table and exported,
+    # with missing values (including unparsed timestamps) as empty strings
+    df = df[DISPLAY_COLUMNS]
+    df = df.assign(Timestamp=df['Timestamp'].dt.strftime(TIMESTAMP_FORMAT))
+    return df.astype('string').fillna('')
+
 class GuildLogAnalyzerApp:
     def __init__(self, root):
         self.root = root
@@ -96,9 +150,17 @@ class GuildLogAnalyzerApp:
 
         self.df = pd.DataFrame()
         self.filtered_df = pd.DataFrame()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._load_id = 0
+        self._closing = False
+        # Streamed URL responses still being read, closed on exit so the
+        # worker threads don't keep the interpreter alive
+        self._open_responses = set()
+        self._mask_cache = OrderedDict()
 
         self.create_widgets()
         self.style_widgets()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
 
     def create_widgets(self):
         # General colors
@@ -163,16 +225,41 @@ class GuildLogAnalyzerApp:
         apply_button = ttk.Button(filter_frame, text="Apply Filters", command=self.apply_filters)
         apply_button.grid(row=3, column=3, padx=5, pady=5, sticky='e')
 
-        # Text Area for Displaying Results
-        self.text_area = tk.Text(self.root, wrap='none', bg=self.bg_color, fg=self.fg_color, insertbackground=self.fg_color)
-        self.text_area.pack(fill='both', expand=True, padx=5, pady=5)
+        # Table for Displaying Results. Only the rows currently in view are
+        # inserted into the Treeview; scrolling re-renders that window from
+        # the filtered DataFrame, so large results stay fast.
+        results_frame = ttk.Frame(self.root)
+        results_frame.pack(fill='both', expand=True, padx=5, pady=5)
+
+        self.tree = ttk.Treeview(results_frame, columns=DISPLAY_COLUMNS, show='headings')
+        for col in DISPLAY_COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=400 if col == 'Details' else 150, stretch=False)
+
+        # view_df stays None until the first filter run, so nothing (not even
+        # the "no records" message) is shown before a log is loaded
+        self.view_df = None
+        self.view_start = 0
+        self.visible_rows = 1
+        self.tree_height = 0
+        # Height of the heading plus borders, measured from the first row once
+        # one has been drawn
+        self.tree_chrome_height = None
+
+        self.no_records_label = ttk.Label(self.tree, text="No records found with the given filters.")
 
         # Scrollbars
-        x_scroll = ttk.Scrollbar(self.text_area, orient='horizontal', command=self.text_area.xview)
-        y_scroll = ttk.Scrollbar(self.text_area, orient='vertical', command=self.text_area.yview)
-        self.text_area.configure(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+        x_scroll = ttk.Scrollbar(results_frame, orient='horizontal', command=self.tree.xview)
+        self.y_scroll = ttk.Scrollbar(results_frame, orient='vertical', command=self.scroll_view)
+        self.tree.configure(xscrollcommand=x_scroll.set)
         x_scroll.pack(side='bottom', fill='x')
-        y_scroll.pack(side='right', fill='y')
+        self.y_scroll.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+
+        self.tree.bind('<Configure>', self.on_tree_resize)
+        self.tree.bind('<MouseWheel>', self.on_mouse_wheel)
+        self.tree.bind('<Button-4>', self.on_mouse_wheel)
+        self.tree.bind('<Button-5>', self.on_mouse_wheel)
 
         # Export Button
         export_button = ttk.Button(self.root, text="Export to CSV", command=self.export_to_csv)
@@ -217,78 +304,142 @@ class GuildLogAnalyzerApp:
                   background=[('active', frame_bg)],
                   arrowcolor=[('active', fg_color)])
 
+        # Results table styles
+        style.configure('Treeview', background=bg_color, fieldbackground=bg_color, foreground=fg_color,
+                        rowheight=TREE_ROW_HEIGHT)
+        style.configure('Treeview.Heading', background=frame_bg, foreground=fg_color)
+        style.map('Treeview.Heading', background=[('active', button_active_bg)])
+
         self.root.configure(background=bg_color)
 
     def load_file(self):
         file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
         if file_path:
-            self.file_label.config(text=file_path)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                self.df = parse_log(file_content)
-                if self.df.empty:
-                    messagebox.showerror("Error", "Failed to parse the log file.")
-                else:
-                    self.df = clean_data(self.df)
-                    self.apply_filters()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load the file: {e}")
+            def load():
+                with open(file_path, 'r', encoding='utf-8', buffering=65536) as f:
+                    return parse_log(f)
+
+            self._load_in_background(load, "Failed to parse the log file.", "Failed to load the file",
+                                     label=file_path)
 
     def load_from_url(self):
         url = self.url_entry.get().strip()
         if not url:
             messagebox.showwarning("Warning", "Please enter a URL.")
             return
+
+        def load():
+            # Stream the body so lines are parsed as they arrive instead of
+            # buffering the whole download first
+            with requests.get(url, stream=True, timeout=30) as response:
+                self._open_responses.add(response)
+                try:
+                    response.raise_for_status()
+                    if response.encoding is None:
+                        response.encoding = 'utf-8'
+                    return parse_log(response.iter_lines(chunk_size=65536, decode_unicode=True))
+                finally:
+                    self._open_responses.discard(response)
+
+        self._load_in_background(load, "Failed to parse the log file from URL.", "Failed to load from URL",
+                                 label=url)
+
+    def _load_in_background(self, load, parse_error, load_error, label):
+        # Parse on a worker thread so large logs don't freeze the window, then
+        # hand the result back to the Tk thread. Each load gets an id so a slow
+        # earlier load can't replace the data from a later one.
+        def load_and_clean():
+            df = load()
+            return df if df.empty else clean_data(df)
+
+        self._load_id += 1
+        load_id = self._load_id
+        future = self._executor.submit(load_and_clean)
+        future.add_done_callback(lambda f: self._schedule_install(load_id, f, parse_error, load_error, label))
+
+    def _schedule_install(self, load_id, future, parse_error, load_error, label):
+        # Runs on the worker thread; once the window is closing the root may
+        # already be destroyed, so there is nothing to hand the result to
+        if self._closing:
+            return
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            file_content = response.text
-            self.df = parse_log(file_content)
-            if self.df.empty:
-                messagebox.showerror("Error", "Failed to parse the log file from URL.")
-            else:
-                self.file_label.config(text=url)
-                self.df = clean_data(self.df)
-                self.apply_filters()
-        except requests.exceptions.RequestException as e:
-            messagebox.showerror("Error", f"Failed to load from URL: {e}")
+            self.root.after(0, self._install_df, load_id, future, parse_error, load_error, label)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call
+            pass
+
+    def _install_df(self, load_id, future, parse_error, load_error, label):
+        if load_id != self._load_id:
+            # Superseded by a newer load
+            return
+
+        try:
+            df = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"{load_error}: {e}")
+            return
+
+        if df.empty:
+            messagebox.showerror("Error", parse_error)
+            return
+
+        self.file_label.config(text=label)
+        self.df = df
+        self._mask_cache.clear()
+        # Timestamps in ascending order (as UTC datetime64) plus the row
+        # positions that produce that order, so date ranges can be found with
+        # a binary search while the table keeps the log's own order
+        timestamps = df['Timestamp'].dt.tz_convert(None).to_numpy()
+        self._ts_order = np.argsort(timestamps, kind='stable')
+        self._ts_sorted = timestamps[self._ts_order]
+        # String views of the columns the find filter searches: the text
+        # columns, plus Level and Timestamp as displayed, so e.g. "40" finds
+        # level-40 rows and "2024-10" or "PM" match on the date shown
+        self._search_columns = [df[col].astype('string') for col in DISPLAY_COLUMNS
+                                if df[col].dtype.kind in 'OU' or col == 'Level']
+        self._search_columns.append(df['Timestamp'].dt.strftime(TIMESTAMP_FORMAT).astype('string'))
+        self.apply_filters()
+
+    def on_close(self):
+        self._closing = True
+        # Drop queued loads and abort streamed downloads still in progress;
+        # Python waits for running worker threads at exit
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for response in list(self._open_responses):
+            # shutdown() unblocks a read in progress on the socket
+            # (urllib3 2.3+); close() alone waits for it to finish
+            shutdown = getattr(response.raw, 'shutdown', None)
+            if shutdown is not None:
+                shutdown()
+        self.root.destroy()
 
     def apply_filters(self):
         if self.df.empty:
             messagebox.showwarning("Warning", "No data to filter. Please load a log file first.")
             return
 
-        self.filtered_df = self.df.copy()
-
-        # Filter by player name
         player_name = self.player_entry.get().strip()
-        if player_name:
-            self.filtered_df = self.filtered_df[self.filtered_df['Player'].str.contains(player_name, case=False, na=False)]
-
-        # Filter by event type
         event_type = self.event_type_combo.get().strip()
-        if event_type:
-            self.filtered_df = self.filtered_df[self.filtered_df['Event Type'].str.contains(event_type, case=False, na=False)]
-
-        # Filter by date range
         start_date_str = self.start_date_entry.get().strip()
         end_date_str = self.end_date_entry.get().strip()
-        if start_date_str and end_date_str:
-            try:
-                start_date = pd.to_datetime(start_date_str)
-                end_date = pd.to_datetime(end_date_str)
-                self.filtered_df['Timestamp'] = pd.to_datetime(self.filtered_df['Timestamp'])
-                self.filtered_df = self.filtered_df[(self.filtered_df['Timestamp'] >= start_date) & (self.filtered_df['Timestamp'] <= end_date)]
-            except ValueError:
-                messagebox.showerror("Error", "Incorrect date format. Please use YYYY-MM-DD.")
+        find_string = self.find_entry.get().strip()
+
+        # Reuse the mask from a recent run with the same filter inputs
+        key = (player_name.lower(), event_type, start_date_str, end_date_str, find_string.lower())
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            mask = self.build_filter_mask(player_name, event_type, start_date_str, end_date_str, find_string)
+            if mask is None:
                 return
+            self._mask_cache[key] = mask
+            if len(self._mask_cache) > MASK_CACHE_SIZE:
+                self._mask_cache.popitem(last=False)
+        else:
+            self._mask_cache.move_to_end(key)
 
-        # Filter by find string
-        find_string = self.find_entry.get().strip()
-        if find_string:
-            mask = self.filtered_df.apply(lambda row: row.astype(str).str.contains(find_string, case=False, na=False).any(), axis=1)
-            self.filtered_df = self.filtered_df[mask]
+        # Only materialize a new frame when some row is actually filtered out;
+        # filtered_df is never modified in place, so sharing self.df is safe
+        self.filtered_df = self.df if mask.all() else self.df[mask]
 
         # Apply sorting
         sort_by = self.sort_by_combo.get().strip()
@@ -301,13 +452,112 @@ class GuildLogAnalyzerApp:
 
         self.display_data(self.filtered_df)
 
+    def build_filter_mask(self, player_name, event_type, start_date_str, end_date_str, find_string):
+        # Boolean mask over self.df selecting the rows that pass every filter,
+        # or None if the filter inputs are invalid
+        df = self.df
+        mask = pd.Series(True, index=df.index)
+
+        # Filter by player name
+        if player_name:
+            mask &= df['_player_lc'].str.contains(player_name.lower(), na=False, regex=False)
+
+        # Filter by event type
+        if event_type:
+            mask &= df['Event Type'] == event_type
+
+        # Filter by date range
+        if start_date_str and end_date_str:
+            try:
+                start_date = pd.to_datetime(start_date_str).tz_localize(_LOCAL_TZ)
+                end_date = pd.to_datetime(end_date_str).tz_localize(_LOCAL_TZ)
+            except ValueError:
+                messagebox.showerror("Error", "Incorrect date format. Please use YYYY-MM-DD.")
+                return None
+            lo = np.searchsorted(self._ts_sorted, start_date.tz_convert(None).to_datetime64(), 'left')
+            hi = np.searchsorted(self._ts_sorted, end_date.tz_convert(None).to_datetime64(), 'right')
+            in_range = np.zeros(len(df), dtype=bool)
+            in_range[self._ts_order[lo:hi]] = True
+            mask &= in_range
+
+        # Filter by find string
+        if find_string:
+            # OR together one vectorized substring search per text column
+            found = pd.Series(False, index=df.index)
+            for column in self._search_columns:
+                found |= column.str.contains(find_string, case=False, na=False, regex=False)
+            mask &= found
+
+        return mask
+
     def display_data(self, df):
-        self.text_area.delete('1.0', tk.END)
-        if df.empty:
-            self.text_area.insert(tk.END, "No records found with the given filters.")
+        self.view_df = df
+        self.render_view(0)
+
+    def render_view(self, start):
+        # Show rows [start, start + visible_rows) of view_df in the Treeview
+        if self.view_df is None:
+            return
+
+        total = len(self.view_df)
+        start = max(0, min(int(start), total - self.visible_rows))
+        stop = min(total, start + self.visible_rows)
+        self.view_start = start
+
+        self.tree.delete(*self.tree.get_children())
+        if total == 0:
+            self.no_records_label.place(relx=0.5, rely=0.5, anchor='center')
+            self.y_scroll.set(0, 1)
+            return
+        self.no_records_label.place_forget()
+
+        rows = [self.tree.insert('', 'end', values=row)
+                for row in format_for_display(self.view_df.iloc[start:stop]).itertuples(index=False)]
+        self.y_scroll.set(start / total, stop / total)
+
+        # The first row's offset is the heading height plus the top border;
+        # the left offset gives the border width for the bottom edge. That x
+        # offset shifts with horizontal scrolling, so only measure while the
+        # table is scrolled fully left.
+        bbox = self.tree.bbox(rows[0]) if self.tree.xview()[0] == 0 else None
+        if bbox and bbox[1] + bbox[0] != self.tree_chrome_height:
+            self.tree_chrome_height = bbox[1] + bbox[0]
+            self.update_visible_rows()
+
+    def scroll_view(self, action, amount, unit=None):
+        # Scrollbar/mouse wheel callback, same arguments as Tk's yview
+        if self.view_df is None:
+            return
+        if action == 'moveto':
+            self.render_view(float(amount) * len(self.view_df))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.render_view(self.view_start + int(amount) * step)
+
+    def on_mouse_wheel(self, event):
+        # <MouseWheel> reports a signed delta (as small as +-1 on macOS), X11
+        # sends Button-4/5 instead
+        if event.num == 4 or (event.num != 5 and event.delta > 0):
+            self.scroll_view('scroll', -3, 'units')
         else:
-            pd.set_option('display.max_rows', None)
-            self.text_area.insert(tk.END, df.to_string(index=False))
+            self.scroll_view('scroll', 3, 'units')
+        # Keep the Treeview's own wheel binding from scrolling as well
+        return 'break'
+
+    def on_tree_resize(self, event):
+        self.tree_height = event.height
+        self.update_visible_rows()
+
+    def update_visible_rows(self):
+        # Number of whole rows that fit below the heading
+        chrome_height = self.tree_chrome_height
+        if chrome_height is None:
+            # No row drawn yet to measure from; estimate from the heading font
+            chrome_height = tkfont.nametofont('TkHeadingFont').metrics('linespace') + 8
+        visible_rows = max(1, (self.tree_height - chrome_height) // TREE_ROW_HEIGHT)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render_view(self.view_start)
 
     def export_to_csv(self):
         if self.filtered_df.empty:
@@ -317,7 +567,16 @@ class GuildLogAnalyzerApp:
         save_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV Files", "*.csv")])
         if save_path:
             try:
-                self.filtered_df.to_csv(save_path, index=False)
+                # Export timestamps as they are displayed, not as ISO datetimes.
+                # Every column is text at this point and pyarrow always quotes
+                # text, so the pandas fallback quotes everything too and both
+                # writers produce the same file.
+                df = format_for_display(self.filtered_df)
+                if pa is not None:
+                    options = pa_csv.WriteOptions(quoting_style='needed', eol='\n')
+                    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), save_path, options)
+                else:
+                    df.to_csv(save_path, index=False, quoting=csv.QUOTE_ALL, lineterminator='\n')
                 messagebox.showinfo("Success", f"Data exported to {save_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export data: {e}")